@@ -0,0 +1,198 @@
+"""
+Collection of helpers used to read and write attributes of many items at once, using NumPy arrays.
+Here is a very basic example:
+
+```
+# import this helper (replace <path_to_repo> by the path to this repository)
+import sys
+sys.path.append("<path_to_repo>/Scripts")
+import AttributeUtils
+
+# gather all the polymeshes of the scene, and resolve their translate attributes once
+translates = AttributeUtils.AttributeArray(AttributeUtils.get_items("project://scene", "GeometryPolymesh"), "translate")
+
+# read all the values in a (item count, value count) array, offset them, and write them back
+values = translates.read()
+values[:, 1] += 10.0
+translates.write(values)
+```
+"""
+
+import ix
+import numpy
+
+
+def get_items(context, class_name = None, recursive = True):
+    """
+    Get the items of a context, optionally filtered by class.
+
+    @param context
+        The context (or a path to one) in which to look for items.
+
+    @param class_name
+        If not None, only items of this class (or inheriting from it) are returned.
+
+    @param recursive
+        If True, items of the sub-contexts are also returned.
+
+    @returns
+        A list of OfObject.
+    """
+    if type(context) == type(""):
+        context = ix.get_item(context)
+
+    if context is None or context.is_context() is False:
+        return []
+    context = context.to_context()
+
+    # get the objects of this context
+    objects = ix.api.OfObjectArray()
+    context.get_objects(objects)
+    items = [ objects[i] for i in range(objects.get_count()) if class_name is None or objects[i].is_kindof(class_name) ]
+
+    # and of its sub-contexts
+    if recursive is True:
+        for i in range(context.get_context_count()):
+            items.extend(get_items(context.get_context(i), class_name, True))
+
+    return items
+
+
+def read(items, attribute, dtype = None):
+    """
+    Read an attribute on a list of items. See AttributeArray.read for details.
+    """
+    return AttributeArray(items, attribute).read(dtype)
+
+
+def write(items, attribute, values, undo = False):
+    """
+    Write an attribute on a list of items. See AttributeArray.write for details.
+    """
+    AttributeArray(items, attribute).write(values, undo)
+
+
+class AttributeArray:
+    """
+    This class resolves an attribute on a list of items once, and then allows reading and writing all the values
+    of those attributes in one go, through NumPy arrays. If you need to read or write the same attribute several times
+    (for instance in an event loop callback) keep an instance around instead of using the read and write functions
+    of this module, to avoid resolving the items and attributes on every call.
+
+    @note
+        The instance keeps the attributes it resolved. If any of the items is deleted, the instance must not be used
+        anymore (reading or writing would access a deleted attribute and can crash Clarisse) so create a new one.
+    """
+
+    def __init__(self, items, attribute):
+        """
+        Initialization method. This will resolve the attribute of all the items.
+
+        @param items
+            A list of items, or of paths to items. If an item doesn't exist, or doesn't have the attribute, an
+            exception is raised.
+
+        @param attribute
+            The name of the attribute.
+        """
+        self.attributes = []
+        for item in items:
+            if type(item) == type(""):
+                path = item
+                item = ix.get_item(path)
+                if item is None:
+                    raise Exception("AttributeUtils - item '{}' doesn't exist.".format(path))
+
+            attr = item.attribute_exists(attribute)
+            if attr is None:
+                raise Exception("AttributeUtils - item '{}' has no attribute '{}'.".format(item.get_full_name(), attribute))
+            self.attributes.append(attr)
+
+        # all attributes must have the same type and hold the same number of values to fit in a single array
+        self.type = self.attributes[0].get_type() if len(self.attributes) > 0 else ix.api.OfAttr.TYPE_DOUBLE
+        self.value_count = self.attributes[0].get_value_count() if len(self.attributes) > 0 else 0
+        for attr in self.attributes:
+            if attr.get_type() != self.type:
+                raise Exception("AttributeUtils - attribute '{}' doesn't have the same type on all items.".format(attribute))
+            if attr.get_value_count() != self.value_count:
+                raise Exception("AttributeUtils - attribute '{}' doesn't have the same value count on all items.".format(attribute))
+
+        # get the accessors and NumPy type matching the attribute type
+        accessors = _ACCESSORS.get(self.type)
+        if accessors is None:
+            raise Exception("AttributeUtils - attribute '{}' is not a double, long or bool attribute.".format(attribute))
+        self._getter, self._setter, self.dtype = accessors
+
+    def __len__(self):
+        """
+        Return the number of items.
+        """
+        return len(self.attributes)
+
+    def read(self, dtype = None):
+        """
+        Read the values of the attribute on all the items.
+
+        @param dtype
+            The NumPy type of the returned array. If None, the type matching the attribute is used (float64 for
+            doubles, int64 for longs and bool for bools)
+
+        @returns
+            A contiguous array of shape (item count, value count)
+        """
+        getter = self._getter
+        values = [ [ getter(attr, j) for j in range(self.value_count) ] for attr in self.attributes ]
+        return numpy.array(values, dtype = self.dtype if dtype is None else dtype).reshape(len(self.attributes), self.value_count)
+
+    def write(self, values, undo = False):
+        """
+        Write the values of the attribute on all the items.
+
+        @param values
+            An array of shape (item count, value count). A 1 dimensional array of item count values is also
+            accepted for attributes holding a single value. It's cast to the type matching the attribute.
+
+        @param undo
+            By default, the values are directly set on the attributes, which is fast but bypasses Clarisse's undo.
+            If True, the values are set through a single undoable command, which is a lot slower.
+        """
+        values = numpy.asarray(values)
+        if values.ndim == 1 and self.value_count == 1:
+            values = values.reshape(-1, 1)
+        if values.shape != (len(self.attributes), self.value_count):
+            raise Exception("AttributeUtils - expected an array of shape {}, got {}.".format((len(self.attributes), self.value_count), values.shape))
+
+        # convert the whole array to Python values at once, instead of converting each value separately
+        rows = values.astype(self.dtype).tolist()
+
+        if undo is True:
+            paths = []
+            strings = []
+            for attr, row in zip(self.attributes, rows):
+                name = attr.get_full_name()
+                for j, value in enumerate(row):
+                    paths.append("{}[{}]".format(name, j))
+                    strings.append(str(int(value)) if self.dtype is bool else str(value))
+            ix.cmds.SetValues(paths, strings)
+            return
+
+        setter = self._setter
+        for attr, row in zip(self.attributes, rows):
+            for j, value in enumerate(row):
+                setter(attr, value, j)
+
+
+#######################################################################################################################
+#
+# The following is meant to be "private", e.g. it's not meant to be used by scripts that import this file as a module.
+#
+#######################################################################################################################
+
+
+# unbound getter and setter methods of OfAttr, and NumPy type, by attribute type. The methods are unbound so that
+# they are looked up only once for all the attributes.
+_ACCESSORS = {
+    ix.api.OfAttr.TYPE_DOUBLE: (ix.api.OfAttr.get_double, ix.api.OfAttr.set_double, numpy.float64),
+    ix.api.OfAttr.TYPE_LONG: (ix.api.OfAttr.get_long, ix.api.OfAttr.set_long, numpy.int64),
+    ix.api.OfAttr.TYPE_BOOL: (ix.api.OfAttr.get_bool, ix.api.OfAttr.set_bool, bool),
+}
@@ -0,0 +1,41 @@
+'''
+This example script shows a simple outliner listing the content of the project, using the lazily loaded
+model of our QtContextModel script. The content of contexts is only read from Clarisse when they are
+expanded (and released when they're collapsed) so the window opens instantly even on huge scenes. The
+script does not return until the window is closed.
+
+Instructions:
+- replace <path_to_repo> by the path to this repository.
+'''
+
+# import the Qt bindings first. You can import PySide, PySide2, PyQt4 or PyQt5
+from PySide2 import QtWidgets
+
+# import our QtHelper and QtContextModel (replace <path_to> by what's needed)
+import sys
+sys.path.append("<path_to_repo>/Scripts")
+import QtHelper
+import QtContextModel
+
+# example callback, selecting the items selected in the view
+def select(selected, deselected):
+    ix.selection.deselect_all()
+    for index in view.selectionModel().selectedRows():
+        ix.selection.add(model.item(index))
+
+# create a tree view on the project
+model = QtContextModel.ContextModel("project://")
+view = QtWidgets.QTreeView()
+view.setModel(model)
+view.setUniformRowHeights(True)
+view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+view.selectionModel().selectionChanged.connect(select)
+view.collapsed.connect(model.release)
+view.setGeometry(50, 50, 400, 600)
+view.setWindowTitle("Outliner")
+
+# show it
+view.show()
+
+# and run. This will not return until the view is closed
+QtHelper.run(view)
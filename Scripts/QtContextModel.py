@@ -0,0 +1,348 @@
+"""
+This module contains a Qt item model exposing Clarisse contexts and items. Children are loaded on demand, when
+the view needs them, so that views on huge scenes open instantly.
+It must be imported AFTER having imported your Qt binding module (PySide(2), PyQt, etc.) and uses QtHelper, so
+the QtHelper script must also be importable. Here is a very basic example:
+
+```
+# import Qt bindings
+from PySide2 import QtWidgets
+# import the helper and the model
+import QtHelper
+import QtContextModel
+
+# create a tree view showing the content of the scene context
+view = QtWidgets.QTreeView()
+view.setModel(QtContextModel.ContextModel("project://scene"))
+view.setUniformRowHeights(True)
+view.collapsed.connect(view.model().release)
+view.show()
+
+# and execute. This call will only return once `view` is closed.
+QtHelper.run(view)
+```
+
+The model doesn't watch the scene. When items change, call `refresh` with the changed items to update only
+their rows, and `reload` with a context when items are added to, removed from, or renamed in it. To free the
+memory used by the content of collapsed contexts, connect the view's `collapsed` signal to `release`.
+"""
+
+import ix
+import sys
+import QtHelper
+
+# get the QtCore module of the Qt binding chosen by QtHelper
+QtCore = sys.modules[QtHelper.QEventLoop.__module__]
+
+
+class ContextModel(QtCore.QAbstractItemModel):
+    """
+    Item model mapping a Clarisse context and its content. It has 2 columns: the name of the items and their class.
+    The item itself is available through the ItemRole role, or the `item` method.
+    """
+
+    # role used to get the OfItem of an index
+    ItemRole = QtCore.Qt.UserRole
+
+    def __init__(self, context = "project://", batch_size = 256, parent = None):
+        """
+        Initialization method.
+
+        @param context
+            The root context (or a path to one) of the model.
+
+        @param batch_size
+            Maximum number of children loaded each time the view asks for more.
+        """
+        QtCore.QAbstractItemModel.__init__(self, parent)
+
+        if type(context) == type(""):
+            path = context
+            context = ix.get_item(path)
+            if context is None or context.is_context() is False:
+                raise Exception("QtContextModel - '{}' is not a context.".format(path))
+
+        if batch_size < 1:
+            raise Exception("QtContextModel - batch_size must be at least 1.")
+
+        self.batch_size = batch_size
+        self._root = _Node(context, context.get_full_name(), None, 0)
+        self._nodes = { self._root.path: self._root }
+
+    def item(self, index):
+        """
+        Return the OfItem of an index, or None for an invalid index.
+        """
+        return index.internalPointer().item if index.isValid() else None
+
+    def index_of(self, item):
+        """
+        Return the index of an item (or of a path to an item) or an invalid index if the item wasn't loaded yet.
+        """
+        node = self._nodes.get(_path(item))
+        return self._index(node) if node is not None else QtCore.QModelIndex()
+
+    def refresh(self, items):
+        """
+        Update the rows of the given items (or paths to items) Items that weren't loaded yet are ignored.
+        """
+        for item in items:
+            node = self._nodes.get(_path(item))
+            if node is None or node is self._root:
+                continue
+            node.data = None
+            self.dataChanged.emit(self._index(node, 0), self._index(node, 1))
+
+    def reload(self, context):
+        """
+        Update the children of a context (or a path to one) Use this when items were added to, removed from, or
+        renamed in it. Only the rows of the removed items are removed, and the new items are inserted. The other rows
+        (and their loaded children) are kept, unless their item was deleted and recreated with the same name, in which
+        case their loaded children are unloaded.
+        """
+        node = self._nodes.get(_path(context))
+        if node is None or node.children is None:
+            return
+
+        # get the current content of the context
+        objects = ix.api.OfObjectArray()
+        node.context.get_objects(objects)
+        context_count = node.context.get_context_count()
+        items = dict()
+        for i in range(context_count):
+            item = node.context.get_context(i)
+            items[item.get_full_name()] = item
+        for i in range(objects.get_count()):
+            items[objects[i].get_full_name()] = objects[i]
+
+        # remove the rows of the loaded children which are no longer there, by runs of consecutive rows
+        parent = self._index(node)
+        row = len(node.children) - 1
+        while row >= 0:
+            if node.children[row].path in items:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and node.children[row].path not in items:
+                row -= 1
+            self.beginRemoveRows(parent, row + 1, last)
+            for child in node.children[row + 1:last + 1]:
+                self._forget(child)
+            del node.children[row + 1:last + 1]
+            # keep the rows of the following children up to date before notifying the views
+            for index in range(row + 1, len(node.children)):
+                node.children[index].row = index
+            self.endRemoveRows()
+
+        # bind the kept children to the current items, in case they were deleted and recreated with the same name.
+        # the handles are compared through their C++ pointers, which doesn't access the (maybe deleted) old item
+        for child in node.children:
+            item = items[child.path]
+            if item.this != child.item.this:
+                self._unload(child)
+                child.item = item
+                child.context = item.to_context() if item.is_context() else None
+            child.data = None
+        if len(node.children) > 0:
+            self.dataChanged.emit(self._index(node.children[0], 0), self._index(node.children[-1], 1))
+
+        # scan the content again to load the new items. A fully loaded context stays fully loaded.
+        fully_loaded = node.pending is None
+        node.pending = [ context_count, objects, 0 ]
+        while fully_loaded and node.pending is not None:
+            self.fetchMore(parent)
+
+    def release(self, index):
+        """
+        Unload the children of a context, freeing the memory they use. They will be loaded again when needed. This is
+        meant to be connected to the `collapsed` signal of a QTreeView.
+        """
+        node = self._node(index)
+        if node is not self._root:
+            self._unload(node)
+
+    #
+    # QAbstractItemModel implementation
+    #
+
+    def index(self, row, column, parent = QtCore.QModelIndex()):
+        node = self._node(parent)
+        if node.children is None or row < 0 or row >= len(node.children) or column < 0 or column >= 2:
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        return self._index(index.internalPointer().parent)
+
+    def rowCount(self, parent = QtCore.QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        children = self._node(parent).children
+        return len(children) if children is not None else 0
+
+    def columnCount(self, parent = QtCore.QModelIndex()):
+        return 2
+
+    def hasChildren(self, parent = QtCore.QModelIndex()):
+        # contexts always report children, so that we don't need to query their content until they're expanded
+        node = self._node(parent)
+        return node.context is not None and (node.children is None or len(node.children) > 0 or node.pending is not None)
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        return node.context is not None and (node.children is None or node.pending is not None)
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        if node.context is None:
+            return
+
+        # first fetch, get the content of the context
+        if node.children is None:
+            node.children = []
+            objects = ix.api.OfObjectArray()
+            node.context.get_objects(objects)
+            node.pending = [ node.context.get_context_count(), objects, 0 ]
+
+        if node.pending is None:
+            return
+
+        # get the next batch of items (sub-contexts first, then objects) skipping the already loaded ones
+        context_count, objects, position = node.pending
+        total = context_count + objects.get_count()
+        batch = []
+        while position < total and len(batch) < self.batch_size:
+            item = node.context.get_context(position) if position < context_count else objects[position - context_count]
+            path = item.get_full_name()
+            loaded = self._nodes.get(path)
+            if loaded is None or loaded.parent is not node:
+                batch.append((item, path))
+            position += 1
+        node.pending[2] = position
+
+        # add them
+        if len(batch) > 0:
+            first = len(node.children)
+            self.beginInsertRows(parent, first, first + len(batch) - 1)
+            for row, (item, path) in enumerate(batch, first):
+                child = _Node(item, path, node, row)
+                node.children.append(child)
+                self._nodes[path] = child
+            self.endInsertRows()
+
+        # release the content array once everything is loaded
+        if position >= total:
+            node.pending = None
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role = QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return ("Name", "Class")[section]
+        return None
+
+    def data(self, index, role = QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == QtCore.Qt.DisplayRole:
+            return self._row_data(node)[index.column()]
+        elif role == self.ItemRole:
+            return node.item
+        return None
+
+    #
+    # private helpers
+    #
+
+    def _node(self, index):
+        """
+        Return the node of an index, the root node for an invalid index.
+        """
+        return index.internalPointer() if index.isValid() else self._root
+
+    def _index(self, node, column = 0):
+        """
+        Return the index of a node, an invalid index for the root node.
+        """
+        if node is None or node is self._root:
+            return QtCore.QModelIndex()
+        return self.createIndex(node.row, column, node)
+
+    def _row_data(self, node):
+        """
+        Get the displayed data of a node. It's read from Clarisse the first time, and kept until the node is refreshed
+        or unloaded.
+        """
+        if node.data is None:
+            item = node.item
+            node.data = (item.get_name(), "Context" if node.context is not None else item.to_object().get_class_name())
+        return node.data
+
+    def _unload(self, node):
+        """
+        Remove the loaded children of a node, so that they will be loaded again when needed.
+        """
+        if node.children is None:
+            return
+        if len(node.children) > 0:
+            self.beginRemoveRows(self._index(node), 0, len(node.children) - 1)
+            for child in node.children:
+                self._forget(child)
+            node.children = []
+            self.endRemoveRows()
+        node.children = None
+        node.pending = None
+
+    def _forget(self, node):
+        """
+        Recursively remove a node and its children from the lookups. This only uses the stored paths, since the
+        items of removed nodes might no longer exist.
+        """
+        if self._nodes.get(node.path) is node:
+            del self._nodes[node.path]
+        if node.children is not None:
+            for child in node.children:
+                self._forget(child)
+
+
+#######################################################################################################################
+#
+# The following is meant to be "private", e.g. it's not meant to be used by scripts that import this file as a module.
+#
+#######################################################################################################################
+
+
+def _path(item):
+    """
+    Return the full name of an item, or the item itself if it's already a path.
+    """
+    return item if type(item) == type("") else item.get_full_name()
+
+
+class _Node(object):
+    """
+    A loaded item of the model.
+    """
+
+    __slots__ = ("item", "path", "context", "parent", "row", "children", "pending", "data")
+
+    def __init__(self, item, path, parent, row):
+        self.item = item
+        # full name of the item when it was loaded, used as the lookup key
+        self.path = path
+        # the item as a context, or None if it's not a context
+        self.context = item.to_context() if item.is_context() else None
+        self.parent = parent
+        self.row = row
+        # loaded children, None until the first fetch
+        self.children = None
+        # sub-context count, objects array and scan position of the children still to load, None once everything is loaded
+        self.pending = None
+        # displayed data, None until first displayed
+        self.data = None
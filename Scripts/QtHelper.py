@@ -97,6 +97,27 @@ def set_stylesheet(filename):
         set_style(css.read())
 
 
+def add_tick_callback(callback):
+    """
+    Add a callback that will be called once per tick of the Qt event loop, right after Qt events were processed.
+    This is useful to batch work (like updating a view) instead of doing it every time something changes.
+
+    @note
+        Callbacks are only called while the Qt event loop is running, e.g. after `run` was called. If a callback
+        raises an exception, the error is logged and the callback is removed.
+    """
+    if callback not in _tick_callbacks:
+        _tick_callbacks.append(callback)
+
+
+def remove_tick_callback(callback):
+    """
+    Remove a callback previously added with add_tick_callback.
+    """
+    if callback in _tick_callbacks:
+        _tick_callbacks.remove(callback)
+
+
 #######################################################################################################################
 #
 # The following is meant to be "private", e.g. it's not meant to be used by scripts that import this file as a module.
@@ -105,6 +126,7 @@ def set_stylesheet(filename):
 
 
 import sys
+import traceback
 
 
 def _get_qt():
@@ -156,6 +178,9 @@ def _get_qt():
 # load QApplication and QEventLoop
 QApplication, QEventLoop = _get_qt()
 
+# callbacks called on each tick of the Qt event loop
+_tick_callbacks = []
+
 def _increment_running_scripts():
     """
     Increment the number of running scripts.
@@ -217,5 +242,13 @@ class QtLoop:
         self.event_loop.processEvents()
         # flush Qt's stacked events
         app().sendPostedEvents(None, 0)
-        # add the callback to Clarisse main loop
+        # add the callback to Clarisse main loop, before the tick callbacks so that a failing one can't stop the loop
         ix.application.add_to_event_loop_single(self.process_events)
+        # call the tick callbacks (iterate on a copy, callbacks might remove themselves)
+        for callback in list(_tick_callbacks):
+            try:
+                callback()
+            except Exception:
+                # log the error once and remove the callback, otherwise it would fail again on every tick
+                ix.log_error("QtHelper - tick callback failed and was removed:\n{}".format(traceback.format_exc()))
+                remove_tick_callback(callback)
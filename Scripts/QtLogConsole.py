@@ -0,0 +1,248 @@
+"""
+This module contains a log sink for Qt tools. Messages are stored in a bounded ring buffer, shown in a Qt view
+updated once per tick of the Qt event loop, and forwarded to Clarisse's log in batches instead of one line at a time.
+It must be imported AFTER having imported your Qt binding module (PySide(2), PyQt, etc.) and uses QtHelper, so
+the QtHelper script must also be importable. Here is a very basic example:
+
+```
+# import Qt bindings
+from PySide2 import QtWidgets
+# import the helper and the console
+import QtHelper
+import QtLogConsole
+
+# create a console keeping the last 10000 messages, and forwarding only warnings and errors to Clarisse's log
+console = QtLogConsole.LogConsole(capacity = 10000, forward_level = QtLogConsole.WARNING)
+view = console.create_view()
+view.show()
+
+# log stuff. This is cheap, the view and Clarisse's log will be updated on the next tick of the Qt event loop (or
+# every `capacity` messages if the loop doesn't tick in the meantime)
+for i in range(100000):
+    console.info("processed item {}".format(i))
+
+# print can also be redirected to the console
+print("done", file = console)
+
+# and execute. This call will only return once `view` is closed.
+QtHelper.run(view)
+console.close()
+```
+"""
+
+import ix
+import sys
+import QtHelper
+from collections import deque
+
+# get the QtCore and QtWidgets (QtGui for Qt4) modules of the Qt binding chosen by QtHelper
+QtCore = sys.modules[QtHelper.QEventLoop.__module__]
+QtWidgets = sys.modules[QtHelper.QApplication.__module__]
+
+# log levels
+INFO = 0
+WARNING = 1
+ERROR = 2
+
+
+class LogConsole(QtCore.QAbstractListModel):
+    """
+    Log sink, which is also the Qt model of the messages it holds. Logging a message only appends it to a pending
+    list. Pending messages are moved to the ring buffer (and thus the model) and forwarded to Clarisse's log once per
+    tick of the Qt event loop, or when `flush` is called.
+    """
+
+    def __init__(self, capacity = 10000, forward_level = INFO, parent = None):
+        """
+        Initialization method. This will register the console in the Qt event loop ticks.
+
+        @param capacity
+            Maximum number of messages kept. When full, the oldest messages are discarded. This is also the maximum
+            number of pending messages: when reached, they are flushed even if the Qt event loop didn't tick.
+
+        @param forward_level
+            Messages of this level or higher are forwarded to Clarisse's log. Use None to disable forwarding.
+        """
+        QtCore.QAbstractListModel.__init__(self, parent)
+        if capacity < 1:
+            raise Exception("QtLogConsole - capacity must be at least 1.")
+        self.capacity = capacity
+        self.forward_level = forward_level
+        self._messages = deque()
+        self._pending = []
+        # text written without a trailing newline, waiting for the rest of the line
+        self._partial = ""
+        QtHelper.add_tick_callback(self.flush)
+
+    def close(self):
+        """
+        Flush the pending messages and unregister the console from the Qt event loop ticks.
+        """
+        self.flush()
+        QtHelper.remove_tick_callback(self.flush)
+
+    def log(self, message, level = INFO):
+        """
+        Log a message.
+        """
+        self._append(level, message)
+
+    def info(self, message):
+        """
+        Log an information message.
+        """
+        self._append(INFO, message)
+
+    def warning(self, message):
+        """
+        Log a warning message.
+        """
+        self._append(WARNING, message)
+
+    def error(self, message):
+        """
+        Log an error message.
+        """
+        self._append(ERROR, message)
+
+    def write(self, text):
+        """
+        File-like interface, so that the console can be used with `print(..., file = console)` or to replace
+        `sys.stdout`. Each non empty line is logged as an information message. Text without a trailing newline is
+        kept until the line is complete, or until the next flush.
+        """
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            if line:
+                self._append(INFO, line)
+
+    def create_view(self, parent = None):
+        """
+        Create a view showing the messages of the console. The view only creates widgets for the visible rows, and
+        automatically scrolls to the new messages when it's scrolled to the bottom.
+        """
+        view = _LogView(parent)
+        view.setModel(self)
+        view.setUniformItemSizes(True)
+        view.setWindowTitle("Log")
+        return view
+
+    def flush(self):
+        """
+        Move the pending messages to the ring buffer and forward them to Clarisse's log. This is automatically called
+        on each tick of the Qt event loop, so you usually don't need to call it.
+        """
+        if self._partial:
+            self._pending.append((INFO, self._partial))
+            self._partial = ""
+        self._flush_pending()
+
+    def _flush_pending(self):
+        """
+        Move the pending messages to the ring buffer and forward them to Clarisse's log, leaving any partial line
+        written through `write` for later.
+        """
+        if len(self._pending) == 0:
+            return
+        pending = self._pending
+        self._pending = []
+
+        # forward to Clarisse's log, one call per run of consecutive messages of the same level
+        if self.forward_level is not None:
+            batch = []
+            batch_level = None
+            for level, message in pending:
+                if level < self.forward_level:
+                    continue
+                if level != batch_level and len(batch) > 0:
+                    _forward(batch_level, batch)
+                    batch = []
+                batch_level = level
+                batch.append(message)
+            if len(batch) > 0:
+                _forward(batch_level, batch)
+
+        # only the last messages can fit in the buffer
+        if len(pending) > self.capacity:
+            pending = pending[-self.capacity:]
+
+        # discard the oldest messages
+        discarded = len(self._messages) + len(pending) - self.capacity
+        if discarded > 0:
+            self.beginRemoveRows(QtCore.QModelIndex(), 0, discarded - 1)
+            for _ in range(discarded):
+                self._messages.popleft()
+            self.endRemoveRows()
+
+        # and add the new ones
+        first = len(self._messages)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(pending) - 1)
+        self._messages.extend(pending)
+        self.endInsertRows()
+
+    def _append(self, level, message):
+        """
+        Add a message to the pending ones. If the Qt event loop didn't tick for a while (for instance during a long
+        synchronous job) the pending messages are flushed when there is as many as the capacity, to keep them bounded.
+        """
+        self._pending.append((level, message))
+        if len(self._pending) >= self.capacity:
+            self._flush_pending()
+
+    #
+    # QAbstractListModel implementation
+    #
+
+    def rowCount(self, parent = QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._messages)
+
+    def data(self, index, role = QtCore.Qt.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return None
+        level, message = self._messages[index.row()]
+        return _PREFIXES[level] + message
+
+
+#######################################################################################################################
+#
+# The following is meant to be "private", e.g. it's not meant to be used by scripts that import this file as a module.
+#
+#######################################################################################################################
+
+
+class _LogView(QtWidgets.QListView):
+    """
+    List view which keeps showing the new messages when it's scrolled to the bottom.
+    """
+
+    def __init__(self, parent = None):
+        QtWidgets.QListView.__init__(self, parent)
+        self._follow = False
+
+    def rowsAboutToBeInserted(self, parent, first, last):
+        scrollbar = self.verticalScrollBar()
+        self._follow = scrollbar.value() == scrollbar.maximum()
+        QtWidgets.QListView.rowsAboutToBeInserted(self, parent, first, last)
+
+    def rowsInserted(self, parent, first, last):
+        QtWidgets.QListView.rowsInserted(self, parent, first, last)
+        if self._follow:
+            self.scrollToBottom()
+
+
+# prefixes of the displayed messages, by level
+_PREFIXES = ("", "Warning: ", "Error: ")
+
+
+def _forward(level, messages):
+    """
+    Forward a batch of messages of the same level to Clarisse's log, in a single call.
+    """
+    text = "\n".join(messages)
+    if level == ERROR:
+        ix.log_error(text)
+    elif level == WARNING:
+        ix.log_warning(text)
+    else:
+        ix.log_info(text)